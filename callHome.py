@@ -1,10 +1,257 @@
 from ncclient import manager
-from ncclient.xml_ import to_ele
+from ncclient.devices.default import DefaultDeviceHandler
+from ncclient.operations import Dispatch, Get
+from ncclient.operations.rpc import RPCError
+from ncclient.operations.util import build_filter
+from ncclient.transport import SSHSession
+from lxml import etree
+from lxml.builder import ElementMaker
+import atexit
+import copy
+import logging
+import socket
+import threading
 import time
-import xml.etree.ElementTree as ET
-from xml.dom.minidom import parseString, Document
+
+log = logging.getLogger("netconf_ru")
+
+SUPERVISION_NS = "urn:o-ran:supervision:1.0"
+UPLANE_NS = "urn:o-ran:uplane-conf:1.0"
+NETCONF_NS = "urn:ietf:params:xml:ns:netconf:base:1.0"
+MPLANE_INTERFACES_NS = "urn:o-ran:mplane-interfaces:1.0"
+NOTIFICATION_NS = "urn:ietf:params:xml:ns:netmod:notification"
+
+NC_OPERATION = f"{{{NETCONF_NS}}}operation"
+NC_DATA = f"{{{NETCONF_NS}}}data"
+
+# XPath queries over replies, compiled once at import and reused on every call
+NS = {"o": SUPERVISION_NS, "up": UPLANE_NS}
+_XP_SUP = etree.XPath("//o:supervision-status/text()", namespaces=NS)
+_XP_TX_ACTIVE = etree.XPath("//up:tx-array-carriers[up:name=$n]/up:active/text()", namespaces=NS)
+_XP_RX_ACTIVE = etree.XPath("//up:rx-array-carriers[up:name=$n]/up:active/text()", namespaces=NS)
+# Plain strings, so the cached name sets do not keep the reply tree alive
+_XP_TX_NAMES = etree.XPath("//up:tx-array-carriers/up:name/text()", namespaces=NS, smart_strings=False)
+_XP_RX_NAMES = etree.XPath("//up:rx-array-carriers/up:name/text()", namespaces=NS, smart_strings=False)
+
+# Longest time, in seconds, a saved response may sit in the response file's buffer
+RESPONSE_FLUSH_INTERVAL = 5
+
+# Element builders for RPC payloads, so requests are sent as trees rather than re-parsed strings
+NC = ElementMaker(namespace=NETCONF_NS, nsmap={None: NETCONF_NS})
+UP = ElementMaker(namespace=UPLANE_NS, nsmap={None: UPLANE_NS})
+MPI = ElementMaker(namespace=MPLANE_INTERFACES_NS, nsmap={None: MPLANE_INTERFACES_NS})
+SV = ElementMaker(namespace=SUPERVISION_NS, nsmap={None: SUPERVISION_NS})
+NTF = ElementMaker(namespace=NOTIFICATION_NS, nsmap={None: NOTIFICATION_NS})
+
+SUPERVISION_STATUS_FILTER = """
+<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <supervision-status xmlns="urn:o-ran:supervision:1.0"/>
+</filter>
+"""
+
+TX_ARRAY_CARRIERS_FILTER = """
+<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
+    <tx-array-carriers/>
+  </user-plane-configuration>
+</filter>
+"""
+
+RX_ARRAY_CARRIERS_FILTER = """
+<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
+    <rx-array-carriers/>
+  </user-plane-configuration>
+</filter>
+"""
+
+CARRIER_NAMES_FILTER = """
+<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
+    <tx-array-carriers>
+      <name/>
+    </tx-array-carriers>
+    <rx-array-carriers>
+      <name/>
+    </rx-array-carriers>
+  </user-plane-configuration>
+</filter>
+"""
+
+STREAMS_FILTER = """
+<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <netconf xmlns="urn:ietf:params:xml:ns:netmod:notification">
+    <streams/>
+  </netconf>
+</filter>
+"""
+
+RU_STATES_FILTER = """
+<filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
+  <hardware xmlns="urn:ietf:params:xml:ns:yang:ietf-hardware">
+    <component>
+      <name>benetel_RU</name>
+      <state/>
+    </component>
+  </hardware>
+</filter>
+"""
+
+
+# Qualified u-plane tag names, built once and shared by every payload builder
+_TAG_TX_CARRIERS = f"{{{UPLANE_NS}}}tx-array-carriers"
+_TAG_RX_CARRIERS = f"{{{UPLANE_NS}}}rx-array-carriers"
+_TAG_NAME = f"{{{UPLANE_NS}}}name"
+_TAG_CBW = f"{{{UPLANE_NS}}}center-of-channel-bandwidth"
+_TAG_AFC = f"{{{UPLANE_NS}}}absolute-frequency-center"
+_TAG_BW = f"{{{UPLANE_NS}}}channel-bandwidth"
+_TAG_GAIN = f"{{{UPLANE_NS}}}gain"
+_TAG_GAIN_CORRECTION = f"{{{UPLANE_NS}}}gain-correction"
+_TAG_N_TA_OFFSET = f"{{{UPLANE_NS}}}n-ta-offset"
+_TAG_ACTIVE = f"{{{UPLANE_NS}}}active"
+
+# Carrier entries parsed once at import; each request deep-copies one and fills in the fields
+_TX_SKELETON = etree.fromstring(
+    b'<tx-array-carriers xmlns="urn:o-ran:uplane-conf:1.0">'
+    b'<name/><center-of-channel-bandwidth/><absolute-frequency-center/><channel-bandwidth/>'
+    b'<type>NR</type><gain/>'
+    b'<downlink-radio-frame-offset>0</downlink-radio-frame-offset><downlink-sfn-offset>0</downlink-sfn-offset>'
+    b'</tx-array-carriers>'
+)
+_RX_SKELETON = etree.fromstring(
+    b'<rx-array-carriers xmlns="urn:o-ran:uplane-conf:1.0">'
+    b'<name/><center-of-channel-bandwidth/><absolute-frequency-center/><channel-bandwidth/>'
+    b'<type>NR</type>'
+    b'<downlink-radio-frame-offset>0</downlink-radio-frame-offset><downlink-sfn-offset>0</downlink-sfn-offset>'
+    b'<gain-correction/><n-ta-offset/>'
+    b'</rx-array-carriers>'
+)
+
+def _from_skeleton(skeleton, fields):
+    """
+    Copy a carrier skeleton and set the text of each child, keyed by qualified tag.
+    """
+    carrier = copy.deepcopy(skeleton)
+    for tag, value in fields.items():
+        carrier.find(tag).text = str(value)
+    return carrier
+
+def _tx_carrier(name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain):
+    """
+    Build a tx-array-carriers element.
+    """
+    return _from_skeleton(_TX_SKELETON, {
+        _TAG_NAME: name,
+        _TAG_CBW: center_of_channel_bandwidth,
+        _TAG_AFC: absolute_frequency_center,
+        _TAG_BW: channel_bandwidth,
+        _TAG_GAIN: gain,
+    })
+
+def _rx_carrier(name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain_correction, n_ta_offset, active=None):
+    """
+    Build an rx-array-carriers element, optionally with an active state.
+    """
+    carrier = _from_skeleton(_RX_SKELETON, {
+        _TAG_NAME: name,
+        _TAG_CBW: center_of_channel_bandwidth,
+        _TAG_AFC: absolute_frequency_center,
+        _TAG_BW: channel_bandwidth,
+        _TAG_GAIN_CORRECTION: gain_correction,
+        _TAG_N_TA_OFFSET: n_ta_offset,
+    })
+    if active:
+        etree.SubElement(carrier, _TAG_ACTIVE).text = active
+    return carrier
+
+def _carrier_states(tx_name, rx_name, active):
+    """
+    Build the TX and RX array carrier entries that set both carriers to the given active state.
+    """
+    states = []
+    for tag, name in ((_TAG_TX_CARRIERS, tx_name), (_TAG_RX_CARRIERS, rx_name)):
+        carrier = etree.Element(tag, nsmap={None: UPLANE_NS})
+        etree.SubElement(carrier, _TAG_NAME).text = str(name)
+        etree.SubElement(carrier, _TAG_ACTIVE).text = active
+        states.append(carrier)
+    return states
+
+def _carrier_status_filter(carrier_tag, name):
+    """
+    Build a subtree filter selecting the active state of one TX or RX array carrier.
+    """
+    return NC.filter(UP("user-plane-configuration", UP(carrier_tag, UP.name(str(name)), UP.active())))
+
+def _create_subscription(stream="NETCONF"):
+    """
+    Build a create-subscription request for the given notification stream.
+    """
+    return NTF("create-subscription", NTF.stream(stream))
+
+def _watchdog_reset(notification_interval=60, guard_timer_overhead=5):
+    """
+    Build a supervision-watchdog-reset request. Both timer values are in seconds.
+    """
+    return SV("supervision-watchdog-reset",
+        SV("supervision-notification-interval", str(notification_interval)),
+        SV("guard-timer-overhead", str(guard_timer_overhead)),
+    )
+
+def _wrap_config(carriers, operation=None):
+    """
+    Wrap carrier elements in a <config> for edit-config, tagging each with nc:operation if given.
+    """
+    if operation:
+        for carrier in carriers:
+            carrier.set(NC_OPERATION, operation)
+    return NC.config(UP("user-plane-configuration", *carriers))
+
+class _SharedSSHSession(SSHSession):
+    """
+    NETCONF session running on its own channel of an already authenticated SSH transport.
+    Closing it closes only the channel, so other sessions on the transport keep working.
+    """
+
+    def attach(self, transport):
+        """
+        Open a netconf subsystem channel on the transport and exchange hellos over it.
+        """
+        self._transport = transport
+        self._connected = True
+        self._closing.clear()
+
+        self._channel = transport.open_session()
+        self._channel_id = self._channel.get_id()
+        self._channel.set_name(f"netconf-subsystem-{self._channel_id}")
+        self._channel.invoke_subsystem("netconf")
+        self._channel_name = self._channel.get_name()
+        if hasattr(self._device_handler, "get_xml_parser"):
+            self.parser = self._device_handler.get_xml_parser(self)
+        self._post_connect()
+
+    def close(self):
+        self._closing.set()
+        if self._channel is not None:
+            self._channel.close()
+        # Wait for the reader thread to leave run() before dropping the channel it reads from
+        while self.is_alive() and (self is not threading.current_thread()):
+            self.join(10)
+        self._channel = None
+        self._connected = False
 
 class NetconfRUClient:
+    # SSH transports shared by every client, keyed by (host, port, username, password) -> [transport, refcount].
+    # The password is part of the key so a client is only handed a transport authenticated with its own credentials.
+    _transport_cache = {}
+    _transport_lock = threading.Lock()
+
+    # Upper bound on RPCs pipelined on the session at once; a few is enough to hide the round-trip
+    MAX_IN_FLIGHT = 4
+
+    # Shared parser for response pretty-printing, so parser setup is paid once.
+    # recover/huge_tree keep odd or very large replies saveable; no entity resolution or ID index is needed.
+    _parser = etree.XMLParser(recover=True, huge_tree=True, collect_ids=False, resolve_entities=False, remove_blank_text=True)
+
     def __init__(self, host, port, username, password, response_file="netconf_responses.xml", capabilities_file='netconf_capabilty.xml'):
         """
         Initialize the connection details for the RU and specify the file for saving responses.
@@ -14,104 +261,314 @@ class NetconfRUClient:
         self.username = username
         self.password = password
         self.session = None
+        # Shared SSH transport this client holds a reference to, see _open_shared_session
+        self._transport = None
         self.response_file = response_file
         self.capabilities_file = capabilities_file
+        # Opened lazily on the first saved response and kept open until close_connection
+        self._response_fp = None
+        self._response_flushed_at = time.monotonic()
+        # Responses may be saved from the watchdog thread as well as the caller's
+        self._response_lock = threading.Lock()
+        self._watchdog_stop = threading.Event()
+        self._watchdog_thread = None
+        # Names of the TX/RX array carriers known to exist on the RU, loaded on connect
+        self._tx_names = set()
+        self._rx_names = set()
 
     def connect(self):
         """
         Establish an SSH NETCONF connection to the RU.
         """
+        if self.session:
+            log.warning("Already connected to RU at %s, close the connection first.", self.host)
+            return
+
         try:
-            self.session = manager.connect(
-                host=self.host,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                hostkey_verify=False
-            )
-            print(f"Successfully connected to RU at {self.host}")
+            device_handler = DefaultDeviceHandler()
+            ssh_session = self._open_shared_session(device_handler)
+            self.session = manager.Manager(ssh_session, device_handler)
+            self._tune_socket()
+            log.info("Successfully connected to RU at %s", self.host)
         except Exception as e:
-            print(f"Failed to connect to RU: {str(e)}")
+            log.error("Failed to connect to RU: %s", e)
             self.session = None
+            self._release_transport()
+            return
+
+        self._refresh_carrier_cache()
 
-    def save_to_file(self, xml_data, message=""):
+    def _refresh_carrier_cache(self):
         """
-        Pretty print the XML response and save it to a file.
+        Load the names of the existing TX and RX array carriers with a single get.
         """
-        # Parse and format the XML string
         try:
-            dom = parseString(xml_data)
-            pretty_xml = dom.toprettyxml(indent="  ")
+            response = self.session.get(filter=CARRIER_NAMES_FILTER)
+            self._tx_names = set(_XP_TX_NAMES(response.data_ele))
+            self._rx_names = set(_XP_RX_NAMES(response.data_ele))
+        except Exception as e:
+            # Not fatal: carriers are still created with nc:operation="create", so the RU rejects duplicates
+            log.warning("Failed to load existing array carrier names: %s", e)
+            self._tx_names = set()
+            self._rx_names = set()
 
-            # Write to the file
-            with open(self.response_file, 'a') as file:
+    def _transport_key(self):
+        """
+        Key of this client's entry in the shared transport cache.
+        """
+        return (self.host, self.port, self.username, self.password)
+
+    def _open_shared_session(self, device_handler):
+        """
+        Open a NETCONF session to the RU, reusing a cached SSH transport to skip the key exchange.
+        The first session authenticates through ncclient's SSHSession.connect, so key file, agent
+        and keyboard-interactive authentication keep working; its transport is then cached.
+        """
+        key = self._transport_key()
+        ssh_session = _SharedSSHSession(device_handler)
+        with self._transport_lock:
+            entry = self._transport_cache.get(key)
+            if entry is not None and not entry[0].is_active():
+                # The cached transport died; drop it so its holders' releases cannot touch the new one
+                entry[0].close()
+                del self._transport_cache[key]
+                entry = None
+
+            if entry is not None:
+                try:
+                    ssh_session.attach(entry[0])
+                except Exception:
+                    ssh_session.close()
+                    raise
+                entry[1] += 1
+            else:
+                try:
+                    ssh_session.connect(
+                        host=self.host,
+                        port=self.port,
+                        username=self.username,
+                        password=self.password,
+                        hostkey_verify=False
+                    )
+                except Exception:
+                    transport = getattr(ssh_session, "_transport", None)
+                    if transport is not None:
+                        transport.close()
+                    raise
+                self._transport_cache[key] = [ssh_session._transport, 1]
+
+        self._transport = ssh_session._transport
+        return ssh_session
+
+    def _release_transport(self):
+        """
+        Drop this client's reference to the shared SSH transport, closing it once nobody uses it.
+        """
+        transport, self._transport = self._transport, None
+        if transport is None:
+            return
+
+        key = self._transport_key()
+        with self._transport_lock:
+            entry = self._transport_cache.get(key)
+            if entry is None or entry[0] is not transport:
+                # Our transport was already replaced after it died; just make sure it is closed
+                transport.close()
+                return
+            entry[1] -= 1
+            if entry[1] <= 0:
+                transport.close()
+                del self._transport_cache[key]
+
+    def _tune_socket(self, user_timeout_ms=30000):
+        """
+        Disable Nagle's algorithm on the NETCONF socket and enable keepalive so a dead RU is noticed quickly.
+        """
+        try:
+            sock = self.session._session._transport.sock
+        except AttributeError:
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # TCP_USER_TIMEOUT is Linux-only
+            if hasattr(socket, "TCP_USER_TIMEOUT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, user_timeout_ms)
+        except OSError as e:
+            log.error("Failed to set socket options: %s", e)
+
+    def save_to_file(self, xml_data, message="", pretty=True):
+        """
+        Pretty print the XML response and save it to a file.
+        xml_data may be a string, bytes, or an already parsed element such as a reply's data_ele;
+        an element is saved with its whole <rpc-reply> envelope, re-indented on a copy so the reply is left untouched.
+        With pretty=False the response is written as received, without being parsed or reindented.
+        """
+        if xml_data is None:
+            log.warning("No XML response to save for %s", message or "request")
+            return
+        if etree.iselement(xml_data):
+            # data_ele shares its tree with the reply, so climb back to the <rpc-reply> envelope
+            xml_data = xml_data.getroottree().getroot()
+        if not pretty:
+            if etree.iselement(xml_data):
+                formatted_xml = etree.tostring(xml_data, encoding="utf-8")
+            else:
+                if isinstance(xml_data, str):
+                    xml_data = xml_data.encode()
+                formatted_xml = xml_data.strip()
+                # Drop the reply's own declaration, which may not appear mid-file
+                if formatted_xml.startswith(b"<?xml"):
+                    formatted_xml = formatted_xml[formatted_xml.find(b"?>") + 2:].lstrip()
+        elif etree.iselement(xml_data):
+            # ncclient keeps the reply's original whitespace, which pretty_print alone would not replace
+            root = copy.deepcopy(xml_data)
+            etree.indent(root)
+            formatted_xml = etree.tostring(root, pretty_print=True, encoding="utf-8")
+        else:
+            # Parse and format the XML string
+            if isinstance(xml_data, str):
+                xml_data = xml_data.encode()
+            try:
+                root = etree.fromstring(xml_data, self._parser)
+            except etree.XMLSyntaxError as e:
+                log.warning("XML response could not be parsed, not saving it: %s", e)
+                return
+            if self._parser.error_log:
+                log.warning("Recovered from errors while parsing XML response: %s", self._parser.error_log)
+            if root is None:
+                log.warning("XML response could not be parsed, not saving it")
+                return
+            formatted_xml = etree.tostring(root, pretty_print=True, encoding="utf-8")
+
+        # Write to the file
+        try:
+            with self._response_lock:
+                fp = self._open_response_file()
                 if message:
-                    file.write(f"\n<!-- {message} -->\n")
-                file.write(pretty_xml)
-                file.write("\n")
-            print(f"Response saved to {self.response_file}")
-        except Exception as e:
-            print(f"Failed to save XML response: {str(e)}")
+                    fp.write(f"\n<!-- {message} -->\n".encode())
+                fp.write(formatted_xml)
+                fp.write(b"\n")
+                self._flush_response_file()
+            log.info("Response saved to %s", self.response_file)
+        except OSError as e:
+            log.error("Failed to save XML response: %s", e)
+
+    def save_stream_to_file(self, xml_data, message=""):
+        """
+        Save a large, already parsed XML response (such as a reply's data_ele) without building
+        a pretty-printed copy of the whole response. The element (and an rpc-reply's <data>) are
+        opened as wrappers and each child is indented and written on its own. The parsed tree itself
+        is left untouched and still held in memory by the caller.
+        """
+        try:
+            with self._response_lock:
+                fp = self._open_response_file()
+                if message:
+                    fp.write(f"\n<!-- {message} -->\n".encode())
+                with etree.xmlfile(fp, encoding="utf-8") as xf:
+                    self._write_streamed_element(xf, xml_data)
+                fp.write(b"\n")
+                self._flush_response_file()
+            log.info("Response saved to %s", self.response_file)
+        except (OSError, etree.LxmlError) as e:
+            log.error("Failed to save XML response: %s", e)
+
+    def _write_streamed_element(self, xf, element, level=0):
+        """
+        Write an already parsed element child by child, descending into an rpc-reply's <data>.
+        Only one child subtree is copied at a time, so the caller's tree keeps its whitespace.
+        """
+        with xf.element(element.tag, attrib=dict(element.attrib), nsmap=element.nsmap):
+            for child in element:
+                if not isinstance(child.tag, str):
+                    continue
+                xf.write("\n" + "  " * (level + 1))
+                if child.tag == NC_DATA:
+                    self._write_streamed_element(xf, child, level + 1)
+                    continue
+                # Indent a detached copy; its tail holds the reply's original whitespace, so drop it
+                subtree = copy.deepcopy(child)
+                subtree.tail = None
+                etree.indent(subtree, level=level + 1)
+                xf.write(subtree)
+            xf.write("\n" + "  " * level)
+
+    def _open_response_file(self):
+        """
+        Return the response file, opening it for buffered appends on first use.
+        """
+        if self._response_fp is None:
+            self._response_fp = open(self.response_file, 'ab', buffering=1 << 20)
+        return self._response_fp
+
+    def _flush_response_file(self, force=False):
+        """
+        Flush the buffered responses to disk if RESPONSE_FLUSH_INTERVAL seconds have passed, or always if force is set.
+        The caller must hold _response_lock.
+        """
+        now = time.monotonic()
+        if self._response_fp is not None and (force or now - self._response_flushed_at >= RESPONSE_FLUSH_INTERVAL):
+            self._response_fp.flush()
+            self._response_flushed_at = now
+
+    def flush_responses(self):
+        """
+        Write any buffered responses to the response file without closing it.
+        """
+        try:
+            with self._response_lock:
+                self._flush_response_file(force=True)
+        except OSError as e:
+            log.error("Failed to flush XML responses: %s", e)
 
     def save_capabilities(self):
         """
         Retrieve and save the NETCONF capabilities supported by the RU in a separate XML file.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
         # Create an XML document for capabilities
-        doc = Document()
-        root = doc.createElement("capabilities")
-        doc.appendChild(root)
-
-        # Loop through the capabilities and add them to the document
+        root = etree.Element("capabilities")
         for capability in self.session.server_capabilities:
-            capability_element = doc.createElement("capability")
-            capability_text = doc.createTextNode(capability)
-            capability_element.appendChild(capability_text)
-            root.appendChild(capability_element)
+            etree.SubElement(root, "capability").text = capability
 
         # Save the document to the capabilities file
-        with open(self.capabilities_file, 'w') as file:
-            file.write(doc.toprettyxml(indent="  "))
+        with open(self.capabilities_file, 'wb') as file:
+            file.write(etree.tostring(root, pretty_print=True, xml_declaration=True, encoding="utf-8"))
 
-        print(f"Capabilities saved to {self.capabilities_file}")
+        log.info("Capabilities saved to %s", self.capabilities_file)
 
     def check_supervision_status(self):
         """
         Retrieve the current supervision status of the O-RU.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return None
 
-        # Corrected XPath to retrieve supervision status
-        filter_payload = """
-        <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <supervision-status xmlns="urn:o-ran:supervision:1.0"/>
-        </filter>
-        """
         try:
-            response = self.session.get(filter=filter_payload)
-            xml_str = response.xml
+            response = self.session.get(filter=SUPERVISION_STATUS_FILTER)
 
             # Save the retrieved status to the file for logging
-            self.save_to_file(response.xml, message="Supervision Status Retrieval")
+            self.save_to_file(response.data_ele, message="Supervision Status Retrieval")
 
-            # Check if supervision status is present in the response
-            if "<supervision-status>unsupervised</supervision-status>" in xml_str:
-                print("Current supervision status: UNSUPERVISED")
+            status = (_XP_SUP(response.data_ele) or [None])[0]
+
+            if status == "unsupervised":
+                log.info("Current supervision status: UNSUPERVISED")
                 return "unsupervised"
-            elif "<supervision-status>supervised</supervision-status>" in xml_str:
-                print("Current supervision status: SUPERVISED")
+            elif status == "supervised":
+                log.info("Current supervision status: SUPERVISED")
                 return "supervised"
             else:
-                print("Supervision status not found in the response.")
+                log.warning("Supervision status not found in the response.")
                 return "unsupervised"
         except Exception as e:
-            print(f"Failed to retrieve supervision status: {str(e)}")
+            log.error("Failed to retrieve supervision status: %s", e)
             return None
 
 
@@ -122,142 +579,146 @@ class NetconfRUClient:
         Subscribe to the /o-ran-supervision:supervision-notification stream to enter supervised mode.
         """
         try:
-            # XML for subscribing to the /o-ran-supervision:supervision-notification stream
-            subscription_rpc = """
-            <rpc xmlns="urn:ietf:params:xml:ns:netconf:base:1.0" message-id="101">
-                <create-subscription xmlns="urn:ietf:params:xml:ns:netmod:notification">
-                    <stream>NETCONF</stream>
-                </create-subscription>
-            </rpc>
-            """
-            
-            # Convert XML to an Element and send the request
-            rpc_element = to_ele(subscription_rpc)
-            response = self.session.dispatch(rpc_element)
+            # Send create-subscription for the NETCONF stream; ncclient assigns the message-id
+            response = self.session.dispatch(_create_subscription())
             
-            print("Subscribed to the supervision notification stream successfully.")
+            log.info("Subscribed to the supervision notification stream successfully.")
              # Save the response to the file
             self.save_to_file(response.xml, message="Supervision Mode entered")
             # print(response.xml)  # Print the response for verification
             return response
         except Exception as e:
-            print(f"Failed to subscribe: {e}")
+            log.error("Failed to subscribe: %s", e)
             return None
         
-    def reset_supervision_watchdog(self):
+    def reset_supervision_watchdog(self, notification_interval=60, guard_timer_overhead=5):
         """
         Reset the supervision watchdog timer using the supervision-watchdog-reset RPC with the provided parameters.
+        notification_interval and guard_timer_overhead are in seconds.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
-        # Build the correct XML structure using ElementTree
-        rpc = ET.Element("rpc", {
-            "xmlns": "urn:ietf:params:xml:ns:netconf:base:1.0",
-            "message-id": "1"
-        })
-
-        # Create the supervision-watchdog-reset element
-        supervision_reset = ET.SubElement(rpc, "supervision-watchdog-reset", {
-            "xmlns": "urn:o-ran:supervision:1.0"
-        })
-
-        # Add sub-elements for notification interval and guard timer
-        notification_interval = ET.SubElement(supervision_reset, "supervision-notification-interval")
-        notification_interval.text = "60000"
-
-        guard_timer_overhead = ET.SubElement(supervision_reset, "guard-timer-overhead")
-        guard_timer_overhead.text = "5"
-
-        # Convert the ElementTree structure to a string
-        watchdog_reset_rpc = ET.tostring(rpc, encoding="utf-8", method="xml").decode('utf-8')
-
         try:
-            # Convert the XML string to an Element using ncclient's to_ele
-            rpc_element = to_ele(watchdog_reset_rpc)
-
-            # Dispatch the RPC request
-            response = self.session.dispatch(rpc_element)
-            print("Supervision watchdog reset successfully.")
+            # Dispatch the RPC request; ncclient adds the <rpc> envelope and message-id
+            response = self.session.dispatch(_watchdog_reset(notification_interval, guard_timer_overhead))
+            log.info("Supervision watchdog reset successfully.")
 
             # Save the response to the file
-            self.save_to_file(response.xml, message="Supervision Watchdog Reset")
+            self.save_to_file(response.xml, message="Supervision Watchdog Reset", pretty=False)
             return response
 
         except Exception as e:
-            print(f"Failed to reset supervision watchdog: {str(e)}")
+            log.error("Failed to reset supervision watchdog: %s", e)
             return None
         
+    def periodically_reset_watchdog(self, interval=60, overhead=10):
+        """
+        Reset the supervision watchdog every interval seconds from a background daemon thread.
+        interval is also sent as the notification interval and overhead as the guard timer overhead, both in seconds.
+        The caller's thread stays free to issue other RPCs on the same session.
+        """
+        if not self.session:
+            log.warning("No active session to the RU. Please connect first.")
+            return
+        if self._watchdog_thread is not None and self._watchdog_thread.is_alive():
+            log.warning("Supervision watchdog reset is already running.")
+            return
+
+        self._watchdog_stop.clear()
+        self._watchdog_thread = threading.Thread(
+            target=self._watchdog_loop, args=(interval, overhead), name="supervision-watchdog", daemon=True)
+        self._watchdog_thread.start()
+        log.info("Resetting the supervision watchdog every %s seconds.", interval)
+
+    def stop_watchdog(self):
+        """
+        Stop the background watchdog reset thread, if it is running.
+        """
+        self._watchdog_stop.set()
+        try:
+            if self._watchdog_thread is not None:
+                self._watchdog_thread.join()
+                self._watchdog_thread = None
+        finally:
+            # The watchdog's saved resets must not be lost, even if the join is interrupted
+            self.flush_responses()
+
+    def _watchdog_loop(self, interval, overhead):
+        """
+        Reset the watchdog on a fixed monotonic schedule until stop_watchdog is called.
+        """
+        next_reset = time.monotonic()
+        while True:
+            self.reset_supervision_watchdog(notification_interval=int(interval), guard_timer_overhead=overhead)
+            # Schedule from the previous deadline, not from now, so RPC time does not add drift
+            next_reset += interval
+            if self._watchdog_stop.wait(max(0, next_reset - time.monotonic())):
+                break
+
     def get_available_streams(self):
         """
         Use the 'get' operation to retrieve available notification streams.
         """
-        filter_xml = """
-        <netconf xmlns="urn:ietf:params:xml:ns:netmod:notification">
-            <streams/>
-        </netconf>
-        """
         try:
-            response = self.session.get(filter=to_ele(filter_xml))
+            response = self.session.get(filter=STREAMS_FILTER)
             # print("Available Notification Streams:")
-            self.save_to_file(response.xml, message="Available Notification Streams")  # This prints the XML response, which will list available streams
+            self.save_to_file(response.data_ele, message="Available Notification Streams")  # This prints the XML response, which will list available streams
         except Exception as e:
-            print(f"Error retrieving notification streams: {str(e)}")
+            log.error("Error retrieving notification streams: %s", e)
     def receive_notifications(self):
         """
         Wait for notifications from the O-RU once the subscription is created.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
-        print("Waiting for notifications...")
+        log.info("Waiting for notifications...")
         try:
             for notification in self.session.take_notification(timeout=10):
                 # Handle the received notification
-                print(f"Received Notification: {notification.notification_xml}")
+                log.info("Received Notification: %s", notification.notification_xml)
                 self.save_to_file(notification.notification_xml, message="Supervision Notification Received")
         except Exception as e:
-            print(f"Failed to receive notifications: {str(e)}")
+            log.error("Failed to receive notifications: %s", e)
 
     def configure_call_home(self, ipv4_address, port, interface_name="MPLANE-INTERFACE", sub_interface="10"):
         """
         Configure the Call Home connection using the specified client IPv4 address, port, interface name, and sub-interface.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
         # Updated XML payload for Call Home based on the provided sample output structure
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-        <mplane-info xmlns="urn:o-ran:mplane-interfaces:1.0">
-            <m-plane-interfaces>
-            <m-plane-sub-interfaces>
-                <interface-name>{interface_name}</interface-name>
-                <sub-interface>{sub_interface}</sub-interface>
-                <client-info>
-                <mplane-ipv4-info>
-                    <mplane-ipv4>{ipv4_address}</mplane-ipv4>
-                    <port>{port}</port>
-                </mplane-ipv4-info>
-                </client-info>
-            </m-plane-sub-interfaces>
-            </m-plane-interfaces>
-        </mplane-info>
-        </config>
-        """
+        config_payload = NC.config(
+            MPI("mplane-info",
+                MPI("m-plane-interfaces",
+                    MPI("m-plane-sub-interfaces",
+                        MPI("interface-name", str(interface_name)),
+                        MPI("sub-interface", str(sub_interface)),
+                        MPI("client-info",
+                            MPI("mplane-ipv4-info",
+                                MPI("mplane-ipv4", str(ipv4_address)),
+                                MPI.port(str(port)),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        )
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"Call Home configuration applied for {ipv4_address}:{port}")
+            log.info("Call Home configuration applied for %s:%s", ipv4_address, port)
             
             # Save the response to the file
             self.save_to_file(response.xml, message="Call Home Configuration Response")
             return response
         except Exception as e:
-            print(f"Failed to configure Call Home: {str(e)}")
+            log.error("Failed to configure Call Home: %s", e)
             return None
         
     def retrieve_tx_array_carrier_info(self):
@@ -265,26 +726,18 @@ class NetconfRUClient:
         Retrieve the TX array carriers using the correct XPath and save the information to the XML file.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return None
 
-        # XPath to retrieve TX array carriers
-        filter_payload = """
-        <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <tx-array-carriers/>
-          </user-plane-configuration>
-        </filter>
-        """
         try:
-            response = self.session.get(filter=filter_payload)
+            response = self.session.get(filter=TX_ARRAY_CARRIERS_FILTER)
             xml_str = response.xml
 
             # Save the TX array carrier information
-            self.save_to_file(response.xml, message="TX Array Carrier Information")
+            self.save_to_file(response.data_ele, message="TX Array Carrier Information")
             return xml_str
         except Exception as e:
-            print(f"Failed to retrieve TX array carrier information: {str(e)}")
+            log.error("Failed to retrieve TX array carrier information: %s", e)
             return None
 
     def retrieve_rx_array_carrier_info(self):
@@ -292,26 +745,18 @@ class NetconfRUClient:
         Retrieve the RX array carriers using the correct XPath and save the information to the XML file.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return None
 
-        # XPath to retrieve RX array carriers
-        filter_payload = """
-        <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <rx-array-carriers/>
-          </user-plane-configuration>
-        </filter>
-        """
         try:
-            response = self.session.get(filter=filter_payload)
+            response = self.session.get(filter=RX_ARRAY_CARRIERS_FILTER)
             xml_str = response.xml
 
             # Save the RX array carrier information
-            self.save_to_file(response.xml, message="RX Array Carrier Information")
+            self.save_to_file(response.data_ele, message="RX Array Carrier Information")
             return xml_str
         except Exception as e:
-            print(f"Failed to retrieve RX array carrier information: {str(e)}")
+            log.error("Failed to retrieve RX array carrier information: %s", e)
             return None
 
     def configure_tx_array_carrier(self, name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain):
@@ -319,42 +764,34 @@ class NetconfRUClient:
         Configure a TX array carrier on the RU using the edit-config RPC if it does not already exist.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
-        # Check if the TX array carrier already exists
-        tx_info = self.retrieve_tx_array_carrier_info()
-        if f"<name>{name}</name>" in tx_info:
-            print(f"TX Array Carrier '{name}' already exists, skipping configuration.")
+        if str(name) in self._tx_names:
+            log.info("TX Array Carrier '%s' already exists, skipping configuration.", name)
             return
 
-        # XML payload for creating TX array carrier
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <tx-array-carriers>
-              <name>{name}</name>
-              <center-of-channel-bandwidth>{center_of_channel_bandwidth}</center-of-channel-bandwidth>
-              <absolute-frequency-center>{absolute_frequency_center}</absolute-frequency-center>
-              <channel-bandwidth>{channel_bandwidth}</channel-bandwidth>
-              <type>NR</type>
-              <gain>{gain}</gain>
-              <downlink-radio-frame-offset>0</downlink-radio-frame-offset>
-              <downlink-sfn-offset>0</downlink-sfn-offset>
-            </tx-array-carriers>
-          </user-plane-configuration>
-        </config>
-        """
+        # XML payload for creating TX array carrier; the RU itself rejects an existing one
+        config_payload = _wrap_config([_tx_carrier(
+            name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain)], operation="create")
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"TX Array Carrier '{name}' configured successfully.")
+            log.info("TX Array Carrier '%s' configured successfully.", name)
+            self._tx_names.add(str(name))
             
             # Save the response to the file
             self.save_to_file(response.xml, message="TX Array Carrier Configuration")
             return response
+        except RPCError as e:
+            if e.tag == "data-exists":
+                log.info("TX Array Carrier '%s' already exists, skipping configuration.", name)
+                self._tx_names.add(str(name))
+                return
+            log.error("Failed to configure TX array carrier: %s", e)
+            return None
         except Exception as e:
-            print(f"Failed to configure TX array carrier: {str(e)}")
+            log.error("Failed to configure TX array carrier: %s", e)
             return None
 
     def configure_rx_array_carrier(self, name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain_correction, n_ta_offset):
@@ -362,43 +799,73 @@ class NetconfRUClient:
         Configure an RX array carrier on the RU using the edit-config RPC if it does not already exist.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
-        # Check if the RX array carrier already exists
-        rx_info = self.retrieve_rx_array_carrier_info()
-        if f"<name>{name}</name>" in rx_info:
-            print(f"RX Array Carrier '{name}' already exists, skipping configuration.")
+        if str(name) in self._rx_names:
+            log.info("RX Array Carrier '%s' already exists, skipping configuration.", name)
             return
 
-        # XML payload for creating RX array carrier
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <rx-array-carriers>
-              <name>{name}</name>
-              <center-of-channel-bandwidth>{center_of_channel_bandwidth}</center-of-channel-bandwidth>
-              <absolute-frequency-center>{absolute_frequency_center}</absolute-frequency-center>
-              <channel-bandwidth>{channel_bandwidth}</channel-bandwidth>
-              <type>NR</type>
-              <downlink-radio-frame-offset>0</downlink-radio-frame-offset>
-              <downlink-sfn-offset>0</downlink-sfn-offset>
-              <gain-correction>{gain_correction}</gain-correction>
-              <n-ta-offset>{n_ta_offset}</n-ta-offset>
-            </rx-array-carriers>
-          </user-plane-configuration>
-        </config>
-        """
+        # XML payload for creating RX array carrier; the RU itself rejects an existing one
+        config_payload = _wrap_config([_rx_carrier(
+            name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain_correction, n_ta_offset)], operation="create")
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"RX Array Carrier '{name}' configured successfully.")
+            log.info("RX Array Carrier '%s' configured successfully.", name)
+            self._rx_names.add(str(name))
             
             # Save the response to the file
             self.save_to_file(response.xml, message="RX Array Carrier Configuration")
             return response
+        except RPCError as e:
+            if e.tag == "data-exists":
+                log.info("RX Array Carrier '%s' already exists, skipping configuration.", name)
+                self._rx_names.add(str(name))
+                return
+            log.error("Failed to configure RX array carrier: %s", e)
+            return None
         except Exception as e:
-            print(f"Failed to configure RX array carrier: {str(e)}")
+            log.error("Failed to configure RX array carrier: %s", e)
+            return None
+
+    def configure_array_carriers(self, tx_carriers=(), rx_carriers=()):
+        """
+        Create several TX and RX array carriers with a single edit-config RPC.
+        Each carrier is a dict of the keyword arguments taken by configure_tx_array_carrier / configure_rx_array_carrier.
+        """
+        if not self.session:
+            log.warning("No active session to the RU. Please connect first.")
+            return
+
+        # Leave out carriers already known to exist, so they do not make the RU reject the whole batch
+        tx_carriers = [carrier for carrier in tx_carriers if str(carrier["name"]) not in self._tx_names]
+        rx_carriers = [carrier for carrier in rx_carriers if str(carrier["name"]) not in self._rx_names]
+        carriers = (
+            [_tx_carrier(**carrier) for carrier in tx_carriers] +
+            [_rx_carrier(**carrier) for carrier in rx_carriers]
+        )
+        if not carriers:
+            log.warning("No new array carriers given, nothing to configure.")
+            return
+
+        try:
+            response = self.session.edit_config(target='running', config=_wrap_config(carriers, operation="create"))
+            log.info("%s TX and %s RX array carriers configured successfully.", len(tx_carriers), len(rx_carriers))
+            self._tx_names.update(str(carrier["name"]) for carrier in tx_carriers)
+            self._rx_names.update(str(carrier["name"]) for carrier in rx_carriers)
+
+            # Save the response to the file
+            self.save_to_file(response.xml, message="Array Carriers Configuration")
+            return response
+        except RPCError as e:
+            if e.tag == "data-exists":
+                log.warning("One or more array carriers already exist, configuration rejected: %s", e)
+                return
+            log.error("Failed to configure array carriers: %s", e)
+            return None
+        except Exception as e:
+            log.error("Failed to configure array carriers: %s", e)
             return None
         
     def delete_tx_array_carrier(self, name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain):
@@ -406,37 +873,23 @@ class NetconfRUClient:
         Delete a TX array carrier from the RU using the edit-config RPC.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
         # XML payload for deleting TX array carrier
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <tx-array-carriers nc:operation="delete"
-              xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0">
-              <name>{name}</name>
-              <center-of-channel-bandwidth>{center_of_channel_bandwidth}</center-of-channel-bandwidth>
-              <absolute-frequency-center>{absolute_frequency_center}</absolute-frequency-center>
-              <channel-bandwidth>{channel_bandwidth}</channel-bandwidth>
-              <type>NR</type>
-              <gain>{gain}</gain>
-              <downlink-radio-frame-offset>0</downlink-radio-frame-offset>
-              <downlink-sfn-offset>0</downlink-sfn-offset>
-            </tx-array-carriers>
-          </user-plane-configuration>
-        </config>
-        """
+        config_payload = _wrap_config([_tx_carrier(
+            name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain)], operation="delete")
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"TX Array Carrier '{name}' deleted successfully.")
+            log.info("TX Array Carrier '%s' deleted successfully.", name)
+            self._tx_names.discard(str(name))
             
             # Save the response to the file
             self.save_to_file(response.xml, message="TX Array Carrier Deletion")
             return response
         except Exception as e:
-            print(f"Failed to delete TX array carrier: {str(e)}")
+            log.error("Failed to delete TX array carrier: %s", e)
             return None
 
     def delete_rx_array_carrier(self, name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain_correction, n_ta_offset):
@@ -444,39 +897,24 @@ class NetconfRUClient:
         Delete an RX array carrier from the RU using the edit-config RPC.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
         # XML payload for deleting RX array carrier
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <rx-array-carriers nc:operation="delete"
-              xmlns:nc="urn:ietf:params:xml:ns:netconf:base:1.0">
-              <name>{name}</name>
-              <center-of-channel-bandwidth>{center_of_channel_bandwidth}</center-of-channel-bandwidth>
-              <absolute-frequency-center>{absolute_frequency_center}</absolute-frequency-center>
-              <channel-bandwidth>{channel_bandwidth}</channel-bandwidth>
-              <type>NR</type>
-              <downlink-radio-frame-offset>0</downlink-radio-frame-offset>
-              <downlink-sfn-offset>0</downlink-sfn-offset>
-              <gain-correction>{gain_correction}</gain-correction>
-              <n-ta-offset>{n_ta_offset}</n-ta-offset>
-              <active>INACTIVE</active>
-            </rx-array-carriers>
-          </user-plane-configuration>
-        </config>
-        """
+        config_payload = _wrap_config([_rx_carrier(
+            name, center_of_channel_bandwidth, absolute_frequency_center, channel_bandwidth, gain_correction, n_ta_offset,
+            active="INACTIVE")], operation="delete")
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"RX Array Carrier '{name}' deleted successfully.")
+            log.info("RX Array Carrier '%s' deleted successfully.", name)
+            self._rx_names.discard(str(name))
             
             # Save the response to the file
             self.save_to_file(response.xml, message="RX Array Carrier Deletion")
             return response
         except Exception as e:
-            print(f"Failed to delete RX array carrier: {str(e)}")
+            log.error("Failed to delete RX array carrier: %s", e)
             return None
 
     def get_running_config(self):
@@ -484,62 +922,48 @@ class NetconfRUClient:
         Retrieve the running configuration of the RU.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
         
         try:
             response = self.session.get_config(source='running')
-            print("Running configuration retrieved successfully.")
+            log.info("Running configuration retrieved successfully.")
             
-            # Save the running configuration to the file
-            self.save_to_file(response.xml, message="Running Configuration")
+            # Stream the running configuration to the file, it can be several MB
+            self.save_stream_to_file(response.data_ele, message="Running Configuration")
             return response.xml
         except Exception as e:
-            print(f"Failed to retrieve running configuration: {str(e)}")
+            log.error("Failed to retrieve running configuration: %s", e)
             return None
         
-    def retrieve_carrier_status(self, tx_name, rx_name):
+    def retrieve_carrier_status(self, tx_name, rx_name, save=False):
         """
         Retrieve the current status (ACTIVE or INACTIVE) of both TX and RX array carriers.
+        The replies are only written to the response file when save is True.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return None, None
 
-        # XPath to retrieve the active status of TX and RX array carriers
-        filter_payload = f"""
-        <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <tx-array-carriers>
-              <name>{tx_name}</name>
-              <active/>
-            </tx-array-carriers>
-            <rx-array-carriers>
-              <name>{rx_name}</name>
-              <active/>
-            </rx-array-carriers>
-          </user-plane-configuration>
-        </filter>
-        """
+        # Separate TX and RX filters so both gets can be in flight at once
+        tx_filter = _carrier_status_filter("tx-array-carriers", tx_name)
+        rx_filter = _carrier_status_filter("rx-array-carriers", rx_name)
         try:
-            response = self.session.get(filter=filter_payload)
-            xml_str = response.xml
+            tx_response, rx_response = self.batch_get([tx_filter, rx_filter])
 
             # Save the retrieved status to the file for logging
-            self.save_to_file(response.xml, message="Carrier Status Retrieval")
+            if save:
+                self.save_to_file(tx_response.data_ele, message="TX Carrier Status Retrieval")
+                self.save_to_file(rx_response.data_ele, message="RX Carrier Status Retrieval")
 
-            # Parse the active status of both TX and RX carriers
-            tx_active = "INACTIVE"
-            rx_active = "INACTIVE"
-            if f"<name>{tx_name}</name>" in xml_str and "<active>ACTIVE</active>" in xml_str:
-                tx_active = "ACTIVE"
-            if f"<name>{rx_name}</name>" in xml_str and "<active>ACTIVE</active>" in xml_str:
-                rx_active = "ACTIVE"
+            # Read the active status of both TX and RX carriers from the already parsed replies
+            tx_active = (_XP_TX_ACTIVE(tx_response.data_ele, n=tx_name) or ["INACTIVE"])[0]
+            rx_active = (_XP_RX_ACTIVE(rx_response.data_ele, n=rx_name) or ["INACTIVE"])[0]
 
-            print(f"Current status - TX: {tx_active}, RX: {rx_active}")
+            log.info("Current status - TX: %s, RX: %s", tx_active, rx_active)
             return tx_active, rx_active
         except Exception as e:
-            print(f"Failed to retrieve carrier status: {str(e)}")
+            log.error("Failed to retrieve carrier status: %s", e)
             return None, None
 
     def activate_carriers(self, tx_name, rx_name):
@@ -548,41 +972,28 @@ class NetconfRUClient:
         The TX array carrier cannot be activated without the RX array carrier being activated in the same RPC message.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
         # Retrieve the current status of TX and RX carriers
-        tx_status, rx_status = self.retrieve_carrier_status(tx_name, rx_name)
+        tx_status, rx_status = self.retrieve_carrier_status(tx_name, rx_name, save=False)
 
         if tx_status == "ACTIVE" and rx_status == "ACTIVE":
-            print(f"Both TX ({tx_name}) and RX ({rx_name}) array carriers are already ACTIVE.")
+            log.info("Both TX (%s) and RX (%s) array carriers are already ACTIVE.", tx_name, rx_name)
             return
 
         # XML payload to activate both TX and RX array carriers if they are inactive
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <tx-array-carriers>
-              <name>{tx_name}</name>
-              <active>ACTIVE</active>
-            </tx-array-carriers>
-            <rx-array-carriers>
-              <name>{rx_name}</name>
-              <active>ACTIVE</active>
-            </rx-array-carriers>
-          </user-plane-configuration>
-        </config>
-        """
+        config_payload = _wrap_config(_carrier_states(tx_name, rx_name, "ACTIVE"))
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"TX Array Carrier '{tx_name}' and RX Array Carrier '{rx_name}' activated successfully.")
+            log.info("TX Array Carrier '%s' and RX Array Carrier '%s' activated successfully.", tx_name, rx_name)
             
             # Save the response to the file
-            self.save_to_file(response.xml, message="Carriers Activation")
+            self.save_to_file(response.xml, message="Carriers Activation", pretty=False)
             return response
         except Exception as e:
-            print(f"Failed to activate carriers: {str(e)}")
+            log.error("Failed to activate carriers: %s", e)
             return None
 
     def deactivate_carriers(self, tx_name, rx_name):
@@ -591,41 +1002,28 @@ class NetconfRUClient:
         The TX array carrier cannot be deactivated without the RX array carrier being deactivated in the same RPC message.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
 
         # Retrieve the current status of TX and RX carriers
-        tx_status, rx_status = self.retrieve_carrier_status(tx_name, rx_name)
+        tx_status, rx_status = self.retrieve_carrier_status(tx_name, rx_name, save=False)
 
         if tx_status == "INACTIVE" and rx_status == "INACTIVE":
-            print(f"Both TX ({tx_name}) and RX ({rx_name}) array carriers are already INACTIVE.")
+            log.info("Both TX (%s) and RX (%s) array carriers are already INACTIVE.", tx_name, rx_name)
             return
 
         # XML payload to deactivate both TX and RX array carriers if they are active
-        config_payload = f"""
-        <config xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <user-plane-configuration xmlns="urn:o-ran:uplane-conf:1.0">
-            <tx-array-carriers>
-              <name>{tx_name}</name>
-              <active>INACTIVE</active>
-            </tx-array-carriers>
-            <rx-array-carriers>
-              <name>{rx_name}</name>
-              <active>INACTIVE</active>
-            </rx-array-carriers>
-          </user-plane-configuration>
-        </config>
-        """
+        config_payload = _wrap_config(_carrier_states(tx_name, rx_name, "INACTIVE"))
 
         try:
             response = self.session.edit_config(target='running', config=config_payload)
-            print(f"TX Array Carrier '{tx_name}' and RX Array Carrier '{rx_name}' deactivated successfully.")
+            log.info("TX Array Carrier '%s' and RX Array Carrier '%s' deactivated successfully.", tx_name, rx_name)
             
             # Save the response to the file
-            self.save_to_file(response.xml, message="Carriers Deactivation")
+            self.save_to_file(response.xml, message="Carriers Deactivation", pretty=False)
             return response
         except Exception as e:
-            print(f"Failed to deactivate carriers: {str(e)}")
+            log.error("Failed to deactivate carriers: %s", e)
             return None
         
 
@@ -634,33 +1032,128 @@ class NetconfRUClient:
         Retrieve the RU states (admin, power, oper, availability, usage) defined in ietf-hardware and o-ran-hardware YANG modules.
         """
         if not self.session:
-            print("No active session to the RU. Please connect first.")
+            log.warning("No active session to the RU. Please connect first.")
             return
         
-        # XPath to retrieve the RU states with the correct namespace
-        filter_payload = """
-        <filter xmlns="urn:ietf:params:xml:ns:netconf:base:1.0">
-          <hardware xmlns="urn:ietf:params:xml:ns:yang:ietf-hardware">
-            <component>
-              <name>benetel_RU</name>
-              <state/>
-            </component>
-          </hardware>
-        </filter>
-        """
-        
         try:
             # Send the get RPC with the proper namespace for ietf-hardware
-            response = self.session.get(filter=filter_payload)
-            print("RU states retrieved successfully.")
+            response = self.session.get(filter=RU_STATES_FILTER)
+            log.info("RU states retrieved successfully.")
             
             # Save the response to the file
-            self.save_to_file(response.xml, message="RU States Response")
+            self.save_to_file(response.data_ele, message="RU States Response")
             return response.xml
         except Exception as e:
-            print(f"Failed to retrieve RU states: {str(e)}")
+            log.error("Failed to retrieve RU states: %s", e)
             return None
         
+    def batch_get(self, filters):
+        """
+        Send one get RPC per filter without waiting in between, then collect all replies.
+        The replies are returned in the same order as the filters.
+        """
+        if not self.session:
+            log.warning("No active session to the RU. Please connect first.")
+            return None
+
+        # Dispatch up to MAX_IN_FLIGHT gets before blocking so the round-trips overlap
+        replies = []
+        for start in range(0, len(filters), self.MAX_IN_FLIGHT):
+            chunk = filters[start:start + self.MAX_IN_FLIGHT]
+            replies.extend(self._pipeline([(Get, {"filter": f}) for f in chunk]))
+        return replies
+
+    def _pipeline(self, requests):
+        """
+        Issue each (operation class, request kwargs) pair as an async RPC, then wait for every reply in order.
+        The operations are built directly rather than by flipping the shared session into async_mode,
+        so RPCs issued from other threads (such as the watchdog) keep their synchronous behaviour.
+        Every operation is built and its filter validated before any is sent, so a bad argument
+        cannot leave earlier RPCs in flight with nobody waiting for their replies.
+        """
+        prepared = []
+        for op_cls, kwargs in requests:
+            rpc = op_cls(
+                self.session._session,
+                device_handler=self.session._device_handler,
+                async_mode=True,
+                timeout=self.session.timeout,
+                raise_mode=self.session.raise_mode,
+            )
+            if kwargs.get("filter") is not None:
+                kwargs = dict(kwargs, filter=build_filter(kwargs["filter"]))
+            prepared.append((rpc, kwargs))
+
+        rpcs = []
+        for rpc, kwargs in prepared:
+            rpc.request(**kwargs)
+            rpcs.append(rpc)
+
+        replies = []
+        for rpc in rpcs:
+            if not rpc.event.wait(self.session.timeout):
+                raise TimeoutError("Timed out waiting for a pipelined RPC reply")
+            if rpc.error is not None:
+                raise rpc.error
+            if rpc.reply.error is not None:
+                raise rpc.reply.error
+            replies.append(rpc.reply)
+        return replies
+
+    def start_supervision(self, stream="NETCONF", notification_interval=60, guard_timer_overhead=5):
+        """
+        Subscribe to notifications, reset the supervision watchdog and fetch the available streams in one pipelined batch.
+        The watchdog timer values are in seconds. Returns the subscription, watchdog reset and streams replies.
+        """
+        if not self.session:
+            log.warning("No active session to the RU. Please connect first.")
+            return None
+
+        try:
+            subscription, watchdog_reset, streams = self._pipeline([
+                (Dispatch, {"rpc_command": _create_subscription(stream)}),
+                (Dispatch, {"rpc_command": _watchdog_reset(notification_interval, guard_timer_overhead)}),
+                (Get, {"filter": STREAMS_FILTER}),
+            ])
+            log.info("Subscribed, reset the supervision watchdog and retrieved streams successfully.")
+
+            # Save the responses to the file, as the individual calls do
+            self.save_to_file(subscription.xml, message="Supervision Mode entered")
+            self.save_to_file(watchdog_reset.xml, message="Supervision Watchdog Reset")
+            self.save_to_file(streams.data_ele, message="Available Notification Streams")
+            return subscription, watchdog_reset, streams
+        except Exception as e:
+            log.error("Failed to start supervision: %s", e)
+            return None
+
+    def refresh_all(self):
+        """
+        Retrieve the supervision status, TX/RX array carriers and RU states in a single batch.
+        """
+        if not self.session:
+            log.warning("No active session to the RU. Please connect first.")
+            return None
+
+        sections = {
+            "Supervision Status Retrieval": SUPERVISION_STATUS_FILTER,
+            "TX Array Carrier Information": TX_ARRAY_CARRIERS_FILTER,
+            "RX Array Carrier Information": RX_ARRAY_CARRIERS_FILTER,
+            "RU States Response": RU_STATES_FILTER,
+        }
+        try:
+            replies = self.batch_get(list(sections.values()))
+            log.info("RU state refreshed successfully.")
+
+            # Save each reply under its own heading, as the individual retrievals do
+            results = {}
+            for message, response in zip(sections, replies):
+                self.save_to_file(response.data_ele, message=message)
+                results[message] = response.xml
+            return results
+        except Exception as e:
+            log.error("Failed to refresh RU state: %s", e)
+            return None
+
     def get_all_state_data(self):
         """
         Perform a generic 'get' operation to retrieve state data and look for the streams manually.
@@ -668,23 +1161,37 @@ class NetconfRUClient:
         try:
             # Sending a generic <get> request without filter
             response = self.session.get()
-            self.save_to_file(response.xml, message="All RU states")  # Print the full XML response
+            self.save_to_file(response.data_ele, message="All RU states")  # Print the full XML response
         except Exception as e:
-            print(f"Error retrieving state data: {str(e)}")
+            log.error("Error retrieving state data: %s", e)
         
 
     def close_connection(self):
         """
-        Close the NETCONF session to the RU.
+        Close the NETCONF session to the RU and flush the saved responses.
         """
+        try:
+            self.stop_watchdog()
+        finally:
+            with self._response_lock:
+                if self._response_fp:
+                    self._response_fp.close()
+                    self._response_fp = None
+
         if self.session:
-            self.session.close_session()
-            print("NETCONF session closed.")
+            try:
+                self.session.close_session()
+            finally:
+                self.session = None
+                self._release_transport()
+            log.info("NETCONF session closed.")
         else:
-            print("No active session to close.")
+            log.warning("No active session to close.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+
     # Initialize the RU client with connection details and specify a file to save XML responses
     ru_client = NetconfRUClient(
         host='10.1.8.14',     # RU IP address
@@ -693,6 +1200,8 @@ if __name__ == "__main__":
         password='aaBB00!$aaBB00!$',  # Password for RU
         response_file="netconf_responses.xml"  # Output file for saving responses
     )
+    # Write out buffered responses even if the script is interrupted before close_connection
+    atexit.register(ru_client.flush_responses)
 
     # Step 1: Connect to the RU
     ru_client.connect()